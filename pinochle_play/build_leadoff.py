@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing as mp
+import os
+import random
+from pathlib import Path
+
+import numpy as np
+
+from pinochle_play.card import Card
+from pinochle_play.game import Game4Player
+from pinochle_play.leadoff import (
+    LEAD_VALUES,
+    NO_LEAD,
+    NUM_BUCKETS,
+    canonical_bucket,
+    encode_lead,
+    table_path,
+)
+from pinochle_play.recorder import GameRecorder
+from pinochle_play.rules import PLAIN_SUITS
+from pinochle_play.selfplay import computer_game
+
+NUM_LEADS = len(PLAIN_SUITS) * LEAD_VALUES
+
+LeadStats = dict[int, np.ndarray]
+
+
+class LeadSampler(GameRecorder):
+    """At every lead, roll out the trick for each distinct card in hand and total the result.
+
+    The result of a rollout is the trick points, positive if the leader's team
+    takes the trick and negative otherwise.
+    """
+
+    def __init__(self, rollouts: int) -> None:
+        """
+        Attributes
+        ----------
+        rollouts (int): Tricks simulated per candidate lead.
+        stats (LeadStats): Per bucket array of (result total, samples) per canonical lead.
+        """
+        self.rollouts = rollouts
+        self.stats: LeadStats = {}
+
+    def on_play(
+        self, game: Game4Player, seat: int, trick: list[Card], card: Card
+    ) -> None:
+        """Sample leads when card starts a trick."""
+        if len(trick) > 0:
+            return
+        hand = game.players[seat].hand + [card]
+        bucket, slots = canonical_bucket(hand, game.used_cards, game.trump_suit)
+        bucket_stats = self.stats.setdefault(bucket, np.zeros((NUM_LEADS, 2)))
+        tried: set[int] = set()
+        for lead in hand:
+            entry = encode_lead(slots.index(lead.suit), lead.value)
+            if entry in tried:
+                continue
+            tried.add(entry)
+            for _ in range(self.rollouts):
+                bucket_stats[entry, 0] += self._rollout(game, seat, lead)
+                bucket_stats[entry, 1] += 1
+
+    def _rollout(self, game: Game4Player, seat: int, lead: Card) -> int:
+        """Play rest of trick after lead on copies of other players' hands."""
+        saved = [player.hand for player in game.players]
+        trick = [lead]
+        try:
+            for idx in range(1, len(game.players)):
+                player = game.players[(seat + idx) % len(game.players)]
+                player.hand = list(player.hand)
+                trick.append(player.play_card(trick, game.used_cards, game.trump_suit))
+        finally:
+            for player, hand in zip(game.players, saved):
+                player.hand = hand
+        winner = game.players[game.trick_winner(trick, seat)]
+        points = game.rules.trick_points(trick)
+        if game.team_of(winner).on_team(game.players[seat]):
+            return points
+        return -points
+
+
+def _sample_leads(seeds: range, rollouts: int, max_score: int) -> LeadStats:
+    """Play one game per seed sampling every lead."""
+    logging.disable(logging.CRITICAL)
+    sampler = LeadSampler(rollouts)
+    for seed in seeds:
+        random.seed(seed)
+        game = computer_game()
+        game.add_recorder(sampler)
+        game.play(max_score=max_score)
+    return sampler.stats
+
+
+def build_table(
+    out_path: str | Path,
+    num_games: int,
+    rollouts: int = 4,
+    min_samples: int = 8,
+    workers: int = 0,
+    max_score: int = 120,
+) -> int:
+    """Simulate games and write best lead per bucket to uint8 npy table. Return buckets filled.
+
+    Buckets whose best lead has fewer than min_samples rollouts are left NO_LEAD.
+    """
+    workers = min(workers or os.cpu_count() or 1, num_games)
+    bounds = np.linspace(0, num_games, workers + 1, dtype=int)
+    stats: LeadStats = {}
+    with mp.Pool(workers) as pool:
+        partials = pool.starmap(
+            _sample_leads,
+            [
+                (range(start, stop), rollouts, max_score)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ],
+        )
+    for partial in partials:
+        for bucket, bucket_stats in partial.items():
+            if bucket in stats:
+                stats[bucket] += bucket_stats
+            else:
+                stats[bucket] = bucket_stats
+
+    table = np.full(NUM_BUCKETS, NO_LEAD, dtype=np.uint8)
+    for bucket, bucket_stats in stats.items():
+        samples = bucket_stats[:, 1]
+        means = np.where(
+            samples >= min_samples, bucket_stats[:, 0] / np.maximum(samples, 1), -np.inf
+        )
+        if np.isfinite(means.max()):
+            table[bucket] = int(means.argmax())
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(out_path, table)
+    filled = int((table != NO_LEAD).sum())
+    logging.info(f"Wrote lead off table {out_path} with {filled} buckets filled")
+    return filled
+
+
+def main() -> None:
+    """Build lead off table from command line."""
+    parser = argparse.ArgumentParser(description="Build pinochle lead off table.")
+    parser.add_argument("--out", default=str(table_path()))
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--rollouts", type=int, default=4)
+    parser.add_argument("--min-samples", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    build_table(
+        args.out,
+        args.games,
+        rollouts=args.rollouts,
+        min_samples=args.min_samples,
+        workers=args.workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
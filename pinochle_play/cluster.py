@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing as mp
+import os
+import random
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from pinochle_play.computer import Computer
+from pinochle_play.game import Game4Player
+from pinochle_play.network import PolicyValueNet
+from pinochle_play.network_computer import NetworkComputer
+from pinochle_play.player import Player
+from pinochle_play.team import Team
+from pinochle_play.workers import WAIT_SECONDS, check_workers
+
+HEADER = struct.Struct("!I")
+
+
+@dataclass(frozen=True)
+class Shard:
+    """Range of seeds played between two strategies.
+
+    Attributes
+    ----------
+    team1 (str): Strategy of team 1 players.
+    team2 (str): Strategy of team 2 players.
+    first_seed (int): First game seed.
+    last_seed (int): Seed after last game.
+    max_score (int): Score ending each game.
+    """
+
+    team1: str
+    team2: str
+    first_seed: int
+    last_seed: int
+    max_score: int = 120
+
+    @property
+    def shard_id(self) -> str:
+        """Unique id used in checkpoint, covering every setting that changes the result."""
+        return f"{self.team1}|{self.team2}|{self.first_seed}|{self.last_seed}|{self.max_score}"
+
+    @property
+    def pair(self) -> str:
+        """Strategy pair key results are merged under."""
+        return f"{self.team1} vs {self.team2}"
+
+
+def make_shards(
+    strategy_pairs: list[tuple[str, str]],
+    first_seed: int,
+    last_seed: int,
+    shard_size: int,
+    max_score: int = 120,
+) -> list[Shard]:
+    """Split seed range of every strategy pair into shards of at most shard_size games."""
+    return [
+        Shard(team1, team2, start, min(start + shard_size, last_seed), max_score)
+        for team1, team2 in strategy_pairs
+        for start in range(first_seed, last_seed, shard_size)
+    ]
+
+
+def make_player(strategy: str, player_name: str) -> Player:
+    """Player for strategy name, Computer or NetworkComputer:<weights path>."""
+    if strategy == "Computer":
+        return Computer(player_name)
+    if strategy.startswith("NetworkComputer:"):
+        return NetworkComputer(player_name, load_net(strategy.split(":", 1)[1]))
+    raise ValueError(f"Unknown strategy {strategy}.")
+
+
+_nets: dict[str, PolicyValueNet] = {}
+
+
+def load_net(path: str) -> PolicyValueNet:
+    """Load network weights once per worker process."""
+    if path not in _nets:
+        _nets[path] = PolicyValueNet.load(path)
+    return _nets[path]
+
+
+def play_shard(shard: Shard) -> dict:
+    """Play every game in shard, returning games, wins, rounds and final scores per team."""
+    result = {"games": 0, "wins": [0, 0], "rounds": 0, "scores": [0, 0]}
+    for seed in range(shard.first_seed, shard.last_seed):
+        random.seed(seed)
+        game = Game4Player()
+        for team_num, strategy in ((1, shard.team1), (2, shard.team2)):
+            team = Team(team_num)
+            team.add_player(make_player(strategy, f"{team_num}a"))
+            team.add_player(make_player(strategy, f"{team_num}b"))
+            game.add_team(team)
+        game.play(max_score=shard.max_score)
+        scores = [team.total_score for team in game.teams]
+        result["games"] += 1
+        result["wins"][scores.index(max(scores))] += 1
+        result["rounds"] += game.round_num
+        result["scores"] = [
+            total + score for total, score in zip(result["scores"], scores)
+        ]
+    return result
+
+
+def merge_results(total: dict, result: dict) -> dict:
+    """Add shard result into running total."""
+    for key, value in result.items():
+        if isinstance(value, list):
+            total[key] = [
+                a + b for a, b in zip(total.get(key, [0] * len(value)), value)
+            ]
+        else:
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+def send_message(sock: socket.socket, message: dict) -> None:
+    """Send length prefixed JSON message."""
+    data = json.dumps(message).encode()
+    sock.sendall(HEADER.pack(len(data)) + data)
+
+
+def recv_message(sock: socket.socket) -> dict | None:
+    """Receive length prefixed JSON message, None if connection closed."""
+    header = _recv_exact(sock, HEADER.size)
+    if header is None:
+        return None
+    data = _recv_exact(sock, HEADER.unpack(header)[0])
+    if data is None:
+        return None
+    return json.loads(data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes | None:
+    """Read exactly size bytes, None if connection closed first."""
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+class Coordinator:
+    """Hand shards to connected workers and checkpoint every completed shard.
+
+    Protocol is length prefixed JSON. A worker sends ready, the coordinator answers
+    with a shard, wait while other workers still hold the last shards, or done, and
+    the worker sends the shard result before asking for more. Completed shards are
+    appended to the checkpoint file as JSON lines, so a restarted coordinator skips
+    them and a shard lost with its worker is handed out again.
+    """
+
+    def __init__(self, shards: list[Shard], checkpoint: str | Path) -> None:
+        """
+        Attributes
+        ----------
+        checkpoint (Path): JSON lines file of completed shards.
+        results (dict[str, dict]): Merged results per strategy pair.
+        pending (deque[Shard]): Shards not yet handed out.
+        remaining (set[str]): Ids of shards not yet completed.
+        lock (threading.Lock): Guards pending, remaining, results and checkpoint.
+        finished (threading.Event): Set once every shard is completed.
+        """
+        self.checkpoint = Path(checkpoint)
+        self.results: dict[str, dict] = {}
+        completed = self._load_checkpoint({shard.shard_id for shard in shards})
+        self.pending: deque[Shard] = deque(
+            shard for shard in shards if shard.shard_id not in completed
+        )
+        self.remaining: set[str] = {shard.shard_id for shard in self.pending}
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        if not self.remaining:
+            self.finished.set()
+        logging.info(
+            f"{len(shards) - len(self.pending)} shards already done, {len(self.pending)} to run"
+        )
+
+    def _load_checkpoint(self, shard_ids: set[str]) -> set[str]:
+        """Merge results of completed shards, cutting off a partly written last line.
+
+        Records of shards not in shard_ids, such as a run with another max score,
+        are skipped rather than merged into this job's results.
+        """
+        completed: set[str] = set()
+        skipped = 0
+        if not self.checkpoint.exists():
+            return completed
+        data = self.checkpoint.read_bytes()
+        if data and not data.endswith(b"\n"):
+            data = data[: data.rfind(b"\n") + 1]
+            logging.warning(f"Dropping partial last line of {self.checkpoint}")
+            with open(self.checkpoint, "r+b") as checkpoint:
+                checkpoint.truncate(len(data))
+        for line in data.decode().splitlines():
+            record = json.loads(line)
+            if record["shard_id"] not in shard_ids:
+                skipped += 1
+                continue
+            if record["shard_id"] in completed:
+                continue
+            completed.add(record["shard_id"])
+            merge_results(self.results.setdefault(record["pair"], {}), record["result"])
+        if skipped:
+            logging.warning(
+                f"Skipped {skipped} shards of {self.checkpoint} not in this job"
+            )
+        return completed
+
+    def next_shard(self) -> Shard | None:
+        """Take next pending shard, None if none left to hand out."""
+        with self.lock:
+            return self.pending.popleft() if self.pending else None
+
+    def requeue(self, shard: Shard) -> None:
+        """Put back shard whose worker disconnected."""
+        with self.lock:
+            if shard.shard_id in self.remaining:
+                self.pending.appendleft(shard)
+
+    def complete(self, shard: Shard, result: dict) -> None:
+        """Checkpoint and merge result of shard, once even if it was run twice."""
+        with self.lock:
+            if shard.shard_id not in self.remaining:
+                return
+            record = {"shard_id": shard.shard_id, "pair": shard.pair, "result": result}
+            with open(self.checkpoint, "a") as checkpoint:
+                checkpoint.write(json.dumps(record) + "\n")
+                checkpoint.flush()
+                os.fsync(checkpoint.fileno())
+            merge_results(self.results.setdefault(shard.pair, {}), result)
+            self.remaining.discard(shard.shard_id)
+            if not self.remaining:
+                self.finished.set()
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> socketserver.TCPServer:
+        """Start serving workers in background threads, return server to read bound port."""
+        coordinator = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                coordinator.handle_worker(self.request)
+
+        server = socketserver.ThreadingTCPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def handle_worker(self, sock: socket.socket) -> None:
+        """Serve shards to one worker connection until it leaves or all are completed.
+
+        A worker asking while every remaining shard is held by another worker is
+        told to wait, so it can pick up a shard requeued from a lost worker.
+        """
+        shard = None
+        try:
+            while recv_message(sock) is not None:
+                shard = self.next_shard()
+                if shard is None:
+                    if self.finished.is_set():
+                        send_message(sock, {"type": "done"})
+                        return
+                    send_message(sock, {"type": "wait"})
+                    continue
+                send_message(sock, {"type": "shard", "shard": asdict(shard)})
+                reply = recv_message(sock)
+                if reply is None:
+                    break
+                self.complete(shard, reply["result"])
+                shard = None
+        except (OSError, ValueError, KeyError) as err:
+            logging.warning(f"Worker connection failed: {err}")
+        if shard is not None:
+            logging.warning(f"Worker lost, requeue shard {shard.shard_id}")
+            self.requeue(shard)
+
+
+def run_worker(host: str, port: int) -> None:
+    """Connect to coordinator and play shards until told done."""
+    logging.disable(logging.CRITICAL)
+    with socket.create_connection((host, port)) as sock:
+        while True:
+            send_message(sock, {"type": "ready"})
+            message = recv_message(sock)
+            if message is None or message["type"] == "done":
+                return
+            if message["type"] == "wait":
+                time.sleep(WAIT_SECONDS)
+                continue
+            shard = Shard(**message["shard"])
+            result = play_shard(shard)
+            send_message(sock, {"type": "result", "result": result})
+
+
+def run_local(
+    shards: list[Shard], checkpoint: str | Path, workers: int = 0
+) -> dict[str, dict]:
+    """Run shards on local worker processes over the socket protocol, return merged results.
+
+    Raises RuntimeError if a worker dies, shards it completed stay checkpointed.
+    """
+    coordinator = Coordinator(shards, checkpoint)
+    server = coordinator.serve()
+    host, port = server.server_address[:2]
+    processes = [
+        mp.Process(target=run_worker, args=(host, port))
+        for _ in range(min(workers or os.cpu_count() or 1, len(coordinator.pending)))
+    ]
+    for process in processes:
+        process.start()
+    try:
+        while not coordinator.finished.wait(timeout=WAIT_SECONDS):
+            check_workers(processes, "Shard")
+        for process in processes:
+            process.join()
+        check_workers(processes, "Shard")
+    finally:
+        server.shutdown()
+        server.server_close()
+    return coordinator.results
+
+
+def main() -> None:
+    """Run coordinator, remote worker or local simulation from command line."""
+    parser = argparse.ArgumentParser(description="Sharded pinochle simulation.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in ("coordinator", "local"):
+        job = subparsers.add_parser(command)
+        job.add_argument("checkpoint")
+        job.add_argument(
+            "--pair",
+            nargs=2,
+            action="append",
+            metavar=("TEAM1", "TEAM2"),
+            help="Strategies to play, Computer or NetworkComputer:<weights path>.",
+        )
+        job.add_argument("--games", type=int, default=1000)
+        job.add_argument("--first-seed", type=int, default=0)
+        job.add_argument("--shard-size", type=int, default=50)
+        job.add_argument("--max-score", type=int, default=120)
+        job.add_argument("--workers", type=int, default=0)
+        job.add_argument("--host", default="127.0.0.1")
+        job.add_argument("--port", type=int, default=5555)
+    worker = subparsers.add_parser("worker")
+    worker.add_argument("--host", default="127.0.0.1")
+    worker.add_argument("--port", type=int, default=5555)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "worker":
+        run_worker(args.host, args.port)
+        return
+    shards = make_shards(
+        [tuple(pair) for pair in args.pair or [("Computer", "Computer")]],
+        args.first_seed,
+        args.first_seed + args.games,
+        args.shard_size,
+        max_score=args.max_score,
+    )
+    if args.command == "local":
+        results = run_local(shards, args.checkpoint, workers=args.workers)
+    else:
+        coordinator = Coordinator(shards, args.checkpoint)
+        server = coordinator.serve(args.host, args.port)
+        coordinator.finished.wait()
+        server.shutdown()
+        results = coordinator.results
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ import random
 
 from pinochle_play.card import Card
 from pinochle_play.common import Suits, Values
+from pinochle_play.leadoff import lookup_lead
 from pinochle_play.player import Player
 
 
@@ -67,16 +68,16 @@ class Computer(Player):
         if len(trick) > 0:
             trick_suit = trick[0].suit
             use_card = self.force_move(trick_suit, trump_suit)
+            # Not forced, either counter or discard in trick suit.
+            if use_card.suit == Suits.NONE:
+                if random.randint(1, 2) > 1:
+                    use_card = self.counter_move(trick_suit)
+                else:
+                    use_card = self.discard_move(trick_suit)
         else:
-            use_card = self.best_leadoff_move()
+            use_card = self.best_leadoff_move(used_cards, trump_suit)
 
-        if not use_card == Card(Suits.NONE, Values.NONE):
-            if random.randint(1, 2) > 1:
-                use_card = self.counter_move(trick_suit)
-            else:
-                use_card = self.discard_move(trick_suit)
-
-        if use_card == Card(Suits.NONE, Values.NONE):
+        if use_card.suit == Suits.NONE:
             while True:
                 use_card = random.choice(self.hand)
                 if self.allowed_move(trick, self.hand, use_card, trump_suit):
@@ -84,10 +85,12 @@ class Computer(Player):
 
         return use_card
 
-    def best_leadoff_move(self) -> Card:
-        """Pick best move when leading off. High trump cards, then bare aces, lower trump, lower cards."""
-        # TODO: insert logic
-        return Card(Suits.NONE, Values.NONE)
+    def best_leadoff_move(self, used_cards: list[Card], trump_suit: Suits) -> Card:
+        """Pick best move when leading off from precomputed lead off table. None card if no table entry."""
+        use_card = lookup_lead(self.hand, used_cards, trump_suit)
+        if use_card.suit != Suits.NONE:
+            logging.debug(f"Lead off table picks {use_card} from hand {self.hand}.")
+        return use_card
 
     def force_move(self, trick_suit: Suits, trump_suit: Suits) -> Card:
         """Force move depending on hand and trick. If one card of trick suit, must play. If one card of trump suit if none trick suit, must play."""
@@ -99,7 +102,7 @@ class Computer(Player):
             return trick_suit_cards[0]
 
         trump_suit_cards = [card for card in self.hand if card.suit == trump_suit]
-        if len(trump_suit_cards) == 1:
+        if len(trick_suit_cards) == 0 and len(trump_suit_cards) == 1:
             logging.debug(
                 f"Must play {trump_suit_cards[0]} since only card in hand {self.hand} of trump suit {trump_suit}."
             )
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pinochle_play.card import Card
+from pinochle_play.common import Suits, Values
+from pinochle_play.player import Player
+from pinochle_play.rules import PLAIN_SUITS, PLAIN_VALUES
+
+if TYPE_CHECKING:
+    from pinochle_play.game import Game4Player
+
+# Every distinct card in the pinochle deck, ordered by suit then value worst to best.
+CARD_TYPES: list[Card] = [
+    Card(suit, value) for suit in PLAIN_SUITS for value in PLAIN_VALUES
+]
+CARD_INDEX: dict[tuple[Suits, Values], int] = {
+    (card.suit, card.value): idx for idx, card in enumerate(CARD_TYPES)
+}
+SUIT_INDEX: dict[Suits, int] = {suit: idx for idx, suit in enumerate(PLAIN_SUITS)}
+NUM_CARD_TYPES = len(CARD_TYPES)
+NUM_SUITS = len(SUIT_INDEX)
+
+# Observation layout, each block starts where the previous one ends.
+HAND_OFFSET = 0
+SEEN_OFFSET = HAND_OFFSET + NUM_CARD_TYPES
+TRICK_OFFSET = SEEN_OFFSET + NUM_CARD_TYPES
+LEAD_OFFSET = TRICK_OFFSET + NUM_CARD_TYPES
+TRUMP_OFFSET = LEAD_OFFSET + NUM_SUITS
+BID_OFFSET = TRUMP_OFFSET + NUM_SUITS
+SCORE_OFFSET = BID_OFFSET + 2
+OBS_SIZE = SCORE_OFFSET + 4
+
+
+def card_index(card: Card) -> int:
+    """Index of card in CARD_TYPES."""
+    return CARD_INDEX[(card.suit, card.value)]
+
+
+def card_counts(cards: list[Card], out: np.ndarray | None = None) -> np.ndarray:
+    """Count of each card type in cards, optionally added into an existing count vector."""
+    if out is None:
+        out = np.zeros(NUM_CARD_TYPES, dtype=np.int16)
+    for card in cards:
+        out[CARD_INDEX[(card.suit, card.value)]] += 1
+    return out
+
+
+def encode_observation(
+    hand: list[Card],
+    seen: list[Card],
+    trick: list[Card],
+    trump_suit: Suits,
+    bid: int,
+    is_bid_team: bool,
+    scores: tuple[int, int, int, int],
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Encode a decision point as a fixed size integer vector.
+
+    Blocks are own hand counts, seen card counts, trick card counts, lead suit,
+    trump suit, bid to meet with a flag if own team holds it, then own round,
+    opponent round, own total and opponent total scores.
+    """
+    if out is None:
+        out = np.zeros(OBS_SIZE, dtype=np.int16)
+    else:
+        out[:] = 0
+    card_counts(hand, out[HAND_OFFSET:SEEN_OFFSET])
+    card_counts(seen, out[SEEN_OFFSET:TRICK_OFFSET])
+    card_counts(trick, out[TRICK_OFFSET:LEAD_OFFSET])
+    if len(trick) > 0:
+        out[LEAD_OFFSET + SUIT_INDEX[trick[0].suit]] = 1
+    if trump_suit != Suits.NONE:
+        out[TRUMP_OFFSET + SUIT_INDEX[trump_suit]] = 1
+    out[BID_OFFSET] = bid
+    out[BID_OFFSET + 1] = int(is_bid_team)
+    out[SCORE_OFFSET:OBS_SIZE] = scores
+    return out
+
+
+def game_observation(
+    game: Game4Player,
+    seat: int,
+    hand: list[Card],
+    trick: list[Card],
+    bid: int,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Encode observation of player at seat from game state, used both to record and to play."""
+    team = game.team_of(game.players[seat])
+    other = next(other for other in game.teams if other is not team)
+    is_bid_team = team.on_team(game.players[game.trump_player])
+    scores = (
+        team.round_score,
+        other.round_score,
+        team.total_score,
+        other.total_score,
+    )
+    return encode_observation(
+        hand, game.used_cards, trick, game.trump_suit, bid, is_bid_team, scores, out
+    )
+
+
+def legal_mask(
+    player: Player,
+    trick: list[Card],
+    trump_suit: Suits,
+    hand: list[Card] | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Mask over card types player may legally play into trick, from given hand or player hand."""
+    if hand is None:
+        hand = player.hand
+    if out is None:
+        out = np.zeros(NUM_CARD_TYPES, dtype=bool)
+    else:
+        out[:] = False
+    for card in hand:
+        idx = CARD_INDEX[(card.suit, card.value)]
+        if not out[idx] and player.allowed_move(trick, hand, card, trump_suit):
+            out[idx] = True
+    return out
@@ -4,18 +4,21 @@ import logging
 import random
 
 from pinochle_play.card import Card
-from pinochle_play.common import Suits, Values
+from pinochle_play.common import Suits
 from pinochle_play.player import Player
+from pinochle_play.recorder import GameRecorder
+from pinochle_play.rules import STANDARD, Variant, compile_rules
 from pinochle_play.team import Team
 
 
 class Game4Player:
-    """Game object for 4 player, 2 on 2 pinochle.."""
+    """Game object for 4 player, 2 on 2 pinochle.. Other variants given by rules variant."""
 
-    def __init__(self) -> None:
+    def __init__(self, variant: Variant = STANDARD) -> None:
         """
         Attributes
         ----------
+        rules (Rules): Deck, meld and trick tables compiled from variant.
         teams (list[Team]): list of teams
         players (list[Player]): list of players
         deck (list[Card]): pinchle deck of cards
@@ -25,7 +28,10 @@ class Game4Player:
         meet_bid (int): Highest bid in current round.
         mmax_score (int): Score of team with highest score.
         used_card (list[Card]): Cards used by players.
+        meld_scores (list[int]): Meld score of each player in current round.
+        recorders (list[GameRecorder]): Recorders notified of decisions and round outcomes.
         """
+        self.rules = compile_rules(variant)
         self.teams: list[Team] = []
         self.players: list[Player] = []
         self.deck: list[Card] = []
@@ -35,20 +41,36 @@ class Game4Player:
         self.meet_bid: int = 0
         self.max_score: int = 0
         self.used_cards: list[Card] = []
+        self.meld_scores: list[int] = []
+        self.recorders: list[GameRecorder] = []
 
     def add_team(self, team: Team) -> None:
         """Add team to game, including players. Add players 1 at a time per team so p1 = team1 p1, p2 = team 2 p1, p3 = team1 p2, etc."""
         self.players = []
         self.teams.append(team)
+        for player in team.players:
+            player.rules = self.rules
+            player.game = self
         # Add players 1 player per team at a time, keep adding until all players on team
         for player_num in range(len(team.players)):
             for team_num in range(len(self.teams)):
                 self.players.append(self.teams[team_num].players[player_num])
         logging.info(f"All players {self.players}")
 
-    def play_round(self) -> None:
-        """Execute full round of pinochle."""
-        self.shuffle_cards()
+    def add_recorder(self, recorder: GameRecorder) -> None:
+        """Add recorder to be notified of every bid, card played and round outcome."""
+        self.recorders.append(recorder)
+
+    def team_of(self, player: Player) -> Team:
+        """Get team given player is on."""
+        return next(team for team in self.teams if team.on_team(player))
+
+    def play_round(self, deck: list[Card] | None = None) -> None:
+        """Execute full round of pinochle, with given deal order or freshly shuffled deck."""
+        if deck is None:
+            self.shuffle_cards()
+        else:
+            self.deck = deck
         self.deal_cards()
         self.bid_round()
         self.score_hands()
@@ -56,14 +78,8 @@ class Game4Player:
         self.cleanup_round()
 
     def shuffle_cards(self) -> None:
-        """Construct pinochle deck 2 of each suit/value card excluding none, then shuffle deck."""
-        self.deck = [
-            Card(suit, value)
-            for value in Values
-            for suit in Suits
-            for _ in range(2)
-            if suit != Suits.NONE and value != Values.NONE
-        ]
+        """Copy pinochle deck of rules variant, then shuffle deck."""
+        self.deck = list(self.rules.deck)
         random.shuffle(self.deck)
 
     def deal_cards(self) -> None:
@@ -81,25 +97,27 @@ class Game4Player:
         for idx in range(len(self.players)):
             player_go = (dealer + idx) % len(self.players)
             player_bid = self.players[player_go].bid(bids_sofar)
+            for recorder in self.recorders:
+                recorder.on_bid(self, player_go, bids_sofar, player_bid)
             if len(bids_sofar) == 0 or player_bid > max(bids_sofar):
                 self.trump_player = player_go
                 logging.info(
                     f"{self.players[player_go].player_name} bid {player_bid}, which is current highest."
                 )
             bids_sofar.append(player_bid)
+        self.meet_bid = max(bids_sofar)
         self.trump_suit = self.players[self.trump_player].call_trump()
         logging.info(
             f"Trump suit: {self.trump_suit} called by {self.players[self.trump_player].player_name} with max bid {max(bids_sofar)}"
         )
-        self.meet_bid = max(bids_sofar)
 
     def score_hands(self) -> None:
         """Score meld hands and set team meet bid for team which trump player is on."""
+        self.meld_scores = []
         for player in self.players:
-            for team in self.teams:
-                if team.on_team(player):
-                    score = player.score_hand(trump_suit=self.trump_suit)
-                    team.add_score(score)
+            score = player.score_hand(trump_suit=self.trump_suit)
+            self.meld_scores.append(score)
+            self.team_of(player).add_score(score)
         for team in self.teams:
             logging.info(f"Team {team.team_num} Score {team.round_score} after meld")
             if team.on_team(self.players[self.trump_player]):
@@ -113,11 +131,12 @@ class Game4Player:
             trick: list[Card] = []
             for idx in range(len(self.players)):
                 turn = (player_go + idx) % len(self.players)
-                trick.append(
-                    self.players[turn].play_card(
-                        trick, self.used_cards, self.trump_suit
-                    )
+                card = self.players[turn].play_card(
+                    trick, self.used_cards, self.trump_suit
                 )
+                for recorder in self.recorders:
+                    recorder.on_play(self, turn, trick, card)
+                trick.append(card)
             player_go = self.trick_winner(trick, player_go)
             self.score_tricks(player_go, trick)
             self.used_cards += trick
@@ -125,34 +144,12 @@ class Game4Player:
 
     def trick_winner(self, trick: list[Card], player_offset: int) -> int:
         """Determine trick winner based on cards played."""
-        winning_player = player_offset
-        for idx, card in enumerate(trick):
-            actual_player = (player_offset + idx) % len(self.players)
-            if idx == 0:
-                best_card = card
-            else:
-                will_beat = self.beat_card(best_card, card, self.trump_suit)
-                if will_beat:
-                    best_card = card
-                    winning_player = actual_player
-        return winning_player
-
-    def beat_card(self, best: Card, current: Card, trump: Suits) -> bool:
-        """Determines winning card based on trump, value of cards.
-        Current card only wins if trump while best isnt or if suits same/trump and current card value higher"""
-        if not best == Card(trump, Values.NONE) and current == Card(trump, Values.NONE):
-            return True
-        if best.suit == current.suit and best < current:
-            return True
-        return False
+        winning_idx = self.rules.trick_winner(trick, self.trump_suit)
+        return (player_offset + winning_idx) % len(self.players)
 
     def score_tricks(self, player: int, trick: list[Card]) -> None:
         """Score tricks for each team. Adjust final score based on making the bid."""
-        point_values = [Values.ACE, Values.TEN, Values.KING]
-        trick_points = 0
-        for card in trick:
-            if card.value in point_values:
-                trick_points += 1
+        trick_points = self.rules.trick_points(trick)
         winning_player = self.players[player]
         logging.info(
             f"{trick} won by {winning_player.player_name} for {trick_points} points"
@@ -166,6 +163,8 @@ class Game4Player:
 
     def cleanup_round(self) -> None:
         """Reset roubd for players and teams."""
+        for recorder in self.recorders:
+            recorder.on_round_end(self)
         for player in self.players:
             player.reset_round()
         self.round_num += 1
@@ -182,9 +181,19 @@ class Game4Player:
         self.trump_suit = Suits.NONE
         self.meet_bid = 0
         self.used_cards = []
+        self.meld_scores = []
 
     def play(self, games: int = 1, max_score: int = 120) -> None:
         """Overall play method to keep playing rounds until max score reached for given number of games."""
+        variant = self.rules.variant
+        if (
+            len(self.teams) != variant.num_teams
+            or len(self.players) != variant.num_players
+        ):
+            raise ValueError(
+                f"{variant.name} needs {variant.num_players} players on {variant.num_teams} teams, "
+                f"got {len(self.players)} on {len(self.teams)}."
+            )
         for _ in range(games):
             logging.debug(f"{self.players}")
             logging.debug(f"{self.teams}")
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from pinochle_play.card import Card
+from pinochle_play.common import Suits, Values
+from pinochle_play.rules import PLAIN_SUITS, PLAIN_VALUES
+
+# Per suit state is hand length capped at 4 with (aces held, aces still out) pairs.
+MAX_LENGTH = 4
+ACE_STATES = [(held, out) for held in range(3) for out in range(3 - held)]
+ACE_STATE_INDEX = {state: idx for idx, state in enumerate(ACE_STATES)}
+SUIT_STATES = (MAX_LENGTH + 1) * len(ACE_STATES)
+NUM_BUCKETS = SUIT_STATES**4
+# Table entry is canonical suit slot * LEAD_VALUES + value index, NO_LEAD if unknown.
+LEAD_VALUES = len(PLAIN_VALUES)
+NO_LEAD = 255
+
+DEFAULT_TABLE_PATH = Path(__file__).parent / "data" / "leadoff.npy"
+
+
+def suit_state(hand: list[Card], seen: list[Card], suit: Suits) -> int:
+    """Summarize hand length and ace control of one suit."""
+    length = 0
+    held = 0
+    for card in hand:
+        if card.suit == suit:
+            length += 1
+            held += card.value == Values.ACE
+    seen_aces = sum(card.suit == suit and card.value == Values.ACE for card in seen)
+    # Decks with more than 2 copies of each card are summarized as if they had 2.
+    held = min(held, 2)
+    out = min(max(2 - held - seen_aces, 0), 2 - held)
+    return min(length, MAX_LENGTH) * len(ACE_STATES) + ACE_STATE_INDEX[(held, out)]
+
+
+def canonical_bucket(
+    hand: list[Card], seen: list[Card], trump_suit: Suits
+) -> tuple[int, list[Suits]]:
+    """Bucket of lead position and suit in each canonical slot.
+
+    Slot 0 is trump, other suits are ordered by descending state so hands that
+    only differ by relabeling non trump suits share a bucket.
+    """
+    others = sorted(
+        (
+            (suit_state(hand, seen, suit), suit)
+            for suit in PLAIN_SUITS
+            if suit != trump_suit
+        ),
+        key=lambda state_suit: state_suit[0],
+        reverse=True,
+    )
+    bucket = suit_state(hand, seen, trump_suit)
+    for state, _ in others:
+        bucket = bucket * SUIT_STATES + state
+    return bucket, [trump_suit] + [suit for _, suit in others]
+
+
+def encode_lead(slot: int, value: Values) -> int:
+    """Table entry for leading value in canonical slot."""
+    return slot * LEAD_VALUES + PLAIN_VALUES.index(value)
+
+
+def decode_lead(entry: int, slots: list[Suits]) -> Card:
+    """Card for table entry given suit in each canonical slot."""
+    slot, value_idx = divmod(entry, LEAD_VALUES)
+    return Card(slots[slot], PLAIN_VALUES[value_idx])
+
+
+def table_path() -> Path:
+    """Lead off table path, overridden by PINOCHLE_LEADOFF_TABLE environment variable."""
+    return Path(os.environ.get("PINOCHLE_LEADOFF_TABLE", DEFAULT_TABLE_PATH))
+
+
+@lru_cache(maxsize=None)
+def load_table(path: Path) -> np.ndarray | None:
+    """Memory map lead off table once per process, pages are shared through the OS cache."""
+    if not path.exists():
+        return None
+    table = np.load(path, mmap_mode="r")
+    if table.shape != (NUM_BUCKETS,) or table.dtype != np.uint8:
+        raise ValueError(
+            f"Lead off table {path} has shape {table.shape} {table.dtype}."
+        )
+    return table
+
+
+def lookup_lead(hand: list[Card], seen: list[Card], trump_suit: Suits) -> Card:
+    """Best lead card in hand from table, None card if no table, entry or matching card."""
+    table = load_table(table_path())
+    if table is None:
+        return Card(Suits.NONE, Values.NONE)
+    bucket, slots = canonical_bucket(hand, seen, trump_suit)
+    entry = int(table[bucket])
+    if entry == NO_LEAD:
+        return Card(Suits.NONE, Values.NONE)
+    lead = decode_lead(entry, slots)
+    for card in hand:
+        if card.suit == lead.suit and card.value == lead.value:
+            return card
+    return Card(Suits.NONE, Values.NONE)
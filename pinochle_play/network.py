@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from pinochle_play.features import NUM_CARD_TYPES, OBS_SIZE
+
+
+class PolicyValueNet:
+    """Small NumPy MLP over encoded observations with card policy and value heads.
+
+    Weights are stored in an npz file as hidden layers w0, b0, w1, b1, ... followed by
+    policy head wp, bp with one logit per card type and value head wv, bv.
+    """
+
+    def __init__(self, weights: dict[str, np.ndarray]) -> None:
+        """
+        Attributes
+        ----------
+        hidden (list[tuple[np.ndarray, np.ndarray]]): Weight and bias of each hidden layer.
+        policy (tuple[np.ndarray, np.ndarray]): Weight and bias of policy head.
+        value (tuple[np.ndarray, np.ndarray]): Weight and bias of value head.
+        """
+        self.hidden: list[tuple[np.ndarray, np.ndarray]] = []
+        while f"w{len(self.hidden)}" in weights:
+            layer = len(self.hidden)
+            self.hidden.append(
+                (
+                    np.asarray(weights[f"w{layer}"], dtype=np.float32),
+                    np.asarray(weights[f"b{layer}"], dtype=np.float32),
+                )
+            )
+        self.policy = (
+            np.asarray(weights["wp"], dtype=np.float32),
+            np.asarray(weights["bp"], dtype=np.float32),
+        )
+        self.value = (
+            np.asarray(weights["wv"], dtype=np.float32).reshape(-1, 1),
+            np.asarray(weights["bv"], dtype=np.float32).reshape(1),
+        )
+        in_size = self.hidden[0][0].shape[0] if self.hidden else self.policy[0].shape[0]
+        if in_size != OBS_SIZE or self.policy[0].shape[1] != NUM_CARD_TYPES:
+            raise ValueError(
+                f"Weights expect {in_size} inputs and {self.policy[0].shape[1]} moves, "
+                f"need {OBS_SIZE} and {NUM_CARD_TYPES}."
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> PolicyValueNet:
+        """Load weights from local npz file."""
+        with np.load(path) as weights:
+            return cls(dict(weights))
+
+    @classmethod
+    def random(
+        cls, hidden_sizes: tuple[int, ...] = (128, 64), seed: int = 0
+    ) -> PolicyValueNet:
+        """Network with small random weights, useful as starting point for training."""
+        rng = np.random.default_rng(seed)
+        sizes = (OBS_SIZE,) + hidden_sizes
+        weights = {}
+        for layer, (fan_in, fan_out) in enumerate(zip(sizes[:-1], sizes[1:])):
+            weights[f"w{layer}"] = rng.normal(0, fan_in**-0.5, (fan_in, fan_out))
+            weights[f"b{layer}"] = np.zeros(fan_out)
+        weights["wp"] = rng.normal(0, sizes[-1] ** -0.5, (sizes[-1], NUM_CARD_TYPES))
+        weights["bp"] = np.zeros(NUM_CARD_TYPES)
+        weights["wv"] = rng.normal(0, sizes[-1] ** -0.5, (sizes[-1], 1))
+        weights["bv"] = np.zeros(1)
+        return cls(weights)
+
+    def save(self, path: str | Path) -> None:
+        """Save weights to local npz file."""
+        weights = {}
+        for layer, (weight, bias) in enumerate(self.hidden):
+            weights[f"w{layer}"] = weight
+            weights[f"b{layer}"] = bias
+        weights["wp"], weights["bp"] = self.policy
+        weights["wv"], weights["bv"] = self.value
+        np.savez(path, **weights)
+
+    def forward(self, obs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Policy logits (N, NUM_CARD_TYPES) and values (N,) for a batch of observations (N, OBS_SIZE)."""
+        hidden = np.asarray(obs, dtype=np.float32)
+        for weight, bias in self.hidden:
+            hidden = hidden @ weight
+            hidden += bias
+            np.maximum(hidden, 0, out=hidden)
+        logits = hidden @ self.policy[0] + self.policy[1]
+        values = (hidden @ self.value[0] + self.value[1])[:, 0]
+        return logits, values
+
+    def best_moves(self, obs: np.ndarray, legal: np.ndarray) -> np.ndarray:
+        """Index of highest scoring legal card type for each row of a batch."""
+        logits, _ = self.forward(obs)
+        logits[~legal] = -np.inf
+        return logits.argmax(axis=1)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+from pinochle_play.card import Card
+from pinochle_play.common import Suits
+from pinochle_play.computer import Computer
+from pinochle_play.features import (
+    SUIT_INDEX,
+    TRUMP_OFFSET,
+    card_index,
+    game_observation,
+    legal_mask,
+)
+from pinochle_play.game import Game4Player
+from pinochle_play.network import PolicyValueNet
+
+
+class NetworkComputer(Computer):
+    """Computer player choosing trump and cards with a policy/value network.
+
+    Observations are read from the game the player was added to, encoded the same
+    way the self play recorder encodes them. Bidding uses the Computer heuristic.
+    """
+
+    def __init__(self, player_name: str, net: PolicyValueNet) -> None:
+        """
+        Attributes
+        ----------
+        net (PolicyValueNet): Network shared by any number of players.
+        """
+        super().__init__(player_name)
+        self.net = net
+
+    def _table(self) -> tuple[Game4Player, int]:
+        """Game player is seated at and its seat."""
+        if self.game is None:
+            raise ValueError(f"{self.player_name} must be added to a game to play.")
+        return self.game, self.game.players.index(self)
+
+    def call_trump(self) -> Suits:
+        """Call suit whose trump observation the value head rates highest, all suits in one batch."""
+        game, seat = self._table()
+        base = game_observation(game, seat, self.hand, [], game.meet_bid)
+        obs = np.repeat(base[None, :], len(SUIT_INDEX), axis=0)
+        for suit, idx in SUIT_INDEX.items():
+            obs[idx, TRUMP_OFFSET + idx] = 1
+        _, values = self.net.forward(obs)
+        suits = list(SUIT_INDEX)
+        return suits[int(values.argmax())]
+
+    def calculate_card(
+        self, trick: list[Card], used_cards: list[Card], trump_suit: Suits
+    ) -> Card:
+        """Play legal card the policy head rates highest."""
+        game, seat = self._table()
+        obs = game_observation(game, seat, self.hand, trick, game.meet_bid)
+        legal = legal_mask(self, trick, trump_suit)
+        move = int(self.net.best_moves(obs[None, :], legal[None, :])[0])
+        use_card = next(card for card in self.hand if card_index(card) == move)
+        logging.debug(f"{self.player_name} network picks {use_card} from {self.hand}")
+        return use_card
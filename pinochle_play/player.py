@@ -3,9 +3,14 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from pinochle_play.card import Card
 from pinochle_play.common import Suits, Values
+from pinochle_play.rules import Rules, compile_rules
+
+if TYPE_CHECKING:
+    from pinochle_play.game import Game4Player
 
 
 @dataclass
@@ -29,10 +34,14 @@ class Player(ABC):
         hand (list[Card]) : the player's current hand of cards.
         player_bid (int): The player's bid.
         use_card (Card): Current card to play, currently None card.
+        rules (Rules): Compiled rules of game, standard until added to a game.
+        game (Game4Player | None): Game player was added to, for players that read the table state.
         """
         self.hand: list[Card] = []
         self.player_bid: int = 0
         self.use_card: Card = Card(Suits.NONE, Values.NONE)
+        self.rules: Rules = compile_rules()
+        self.game: Game4Player | None = None
 
     def __eq__(self, other) -> bool:
         """Determines if the same player."""
@@ -68,82 +77,7 @@ class Player(ABC):
     def score_hand(self, trump_suit: Suits = Suits.NONE) -> int:
         """Find out score of players hand based on melds, marraiges, runs, pinochle, 4kind."""
         # TODO Add seen cards for melds to pool of used cards for players to keep track of
-        hand_score = self._score_pinochle()
-        hand_score += self._score_meld(trump_suit)
-        hand_score += self._score_marraiges(trump_suit)
-        hand_score += self._score_runs()
-        hand_score += self._score_4kind()
-        return hand_score
-
-    def _score_pinochle(self) -> int:
-        """Pinochle gives score of 4."""
-        if (
-            Card(Suits.DIAMOND, Values.JACK) in self.hand
-            and Card(Suits.CLUB, Values.QUEEN) in self.hand
-        ):
-            logging.debug("Pinochle, 4 points total.")
-            return 4
-        return 0
-
-    def _score_meld(self, trump_suit: Suits) -> int:
-        """Score number of 9s in hand that match trump."""
-        logging.debug(
-            f"Meld suit {trump_suit.value}, {self.hand.count(Card(trump_suit, Values.NINE))} points total."
-        )
-        return self.hand.count(Card(trump_suit, Values.NINE))
-
-    def _score_marraiges(self, trump_suit: Suits) -> int:
-        """Check for marraige of each suit in hand. If"""
-        marraige_score = 0
-        for suit in Suits:
-            if (
-                Card(suit, Values.KING) in self.hand
-                and Card(suit, Values.QUEEN) in self.hand
-            ):
-                if suit == Suits.NONE:
-                    continue
-                marraige_score += 4 if suit == trump_suit else 2
-                logging.debug(
-                    f"Marraige suit {suit.value}, {marraige_score} points total."
-                )
-        return marraige_score
-
-    def _score_runs(self) -> int:
-        """Runs give 15."""
-        run_score = 0
-        for suit in Suits:
-            if (
-                Card(suit, Values.ACE) in self.hand
-                and Card(suit, Values.TEN) in self.hand
-                and Card(suit, Values.KING) in self.hand
-                and Card(suit, Values.QUEEN) in self.hand
-                and Card(suit, Values.JACK) in self.hand
-            ):
-                if suit == Suits.NONE:
-                    continue
-                run_score += 15
-                logging.debug(f"Run suit {suit.value}, {run_score} points total.")
-        return run_score
-
-    def _score_4kind(self) -> int:
-        """4 of a kind scoring."""
-        kind_score = 0
-        four_kind_values = {
-            Values.ACE: 10,
-            Values.KING: 8,
-            Values.QUEEN: 6,
-            Values.JACK: 4,
-        }
-        for value, point_value in four_kind_values.items():
-            if (
-                Card(Suits.CLUB, value) in self.hand
-                and Card(Suits.DIAMOND, value) in self.hand
-                and Card(Suits.HEART, value) in self.hand
-                and Card(Suits.SPADE, value) in self.hand
-            ):
-                logging.debug(f"4 of a Kind {value} {point_value} points added.")
-                kind_score += point_value
-        return kind_score
+        return self.rules.score_meld(self.hand, trump_suit)
 
     def allowed_move(
         self, trick: list[Card], hand: list[Card], card: Card, trump_suit: Suits
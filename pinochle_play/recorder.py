@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pinochle_play.card import Card
+
+if TYPE_CHECKING:
+    from pinochle_play.game import Game4Player
+
+
+class GameRecorder:
+    """Receives decisions and outcomes from a game. Subclasses override the hooks they need."""
+
+    def on_bid(
+        self, game: Game4Player, seat: int, bids_sofar: list[int], bid: int
+    ) -> None:
+        """Called after player at seat bids, before bid added to bids so far."""
+        pass
+
+    def on_play(
+        self, game: Game4Player, seat: int, trick: list[Card], card: Card
+    ) -> None:
+        """Called after player at seat plays card, before card added to trick."""
+        pass
+
+    def on_round_end(self, game: Game4Player) -> None:
+        """Called at round cleanup before team scores are totaled and reset."""
+        pass
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+
+from pinochle_play.game import Game4Player
+from pinochle_play.recorder import GameRecorder
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    variant TEXT NOT NULL,
+    players TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    game_id INTEGER NOT NULL REFERENCES games (game_id),
+    round_num INTEGER NOT NULL,
+    variant TEXT NOT NULL,
+    trump TEXT NOT NULL,
+    bid INTEGER NOT NULL,
+    caller_seat INTEGER NOT NULL,
+    caller_name TEXT NOT NULL,
+    caller_strategy TEXT NOT NULL,
+    caller_team INTEGER NOT NULL,
+    made_bid INTEGER NOT NULL,
+    PRIMARY KEY (game_id, round_num)
+);
+CREATE TABLE IF NOT EXISTS seats (
+    game_id INTEGER NOT NULL REFERENCES games (game_id),
+    round_num INTEGER NOT NULL,
+    seat INTEGER NOT NULL,
+    player_name TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    team_num INTEGER NOT NULL,
+    bid INTEGER NOT NULL,
+    meld INTEGER NOT NULL,
+    team_meld INTEGER NOT NULL,
+    team_trick_points INTEGER NOT NULL,
+    team_round_result INTEGER NOT NULL,
+    team_total INTEGER NOT NULL,
+    PRIMARY KEY (game_id, round_num, seat)
+);
+CREATE INDEX IF NOT EXISTS rounds_trump_strategy ON rounds (trump, caller_strategy, made_bid);
+CREATE INDEX IF NOT EXISTS rounds_strategy ON rounds (caller_strategy);
+CREATE INDEX IF NOT EXISTS seats_strategy ON seats (strategy, seat);
+"""
+INSERTS = {
+    "rounds": "INSERT INTO rounds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "seats": "INSERT INTO seats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+}
+
+
+class ResultStore(GameRecorder):
+    """SQLite store of round outcomes, written in batched transactions by a background thread.
+
+    Add to a game with Game4Player.add_recorder, rows are queued at every round
+    cleanup. Each game gets its own id from the games table the first time one
+    of its rounds ends. Close when done to flush the last batch, a failed write
+    is raised from flush or close.
+    """
+
+    def __init__(
+        self, path: str | Path, batch_size: int = 1000, queue_size: int = 10000
+    ) -> None:
+        """
+        Attributes
+        ----------
+        path (Path): SQLite database file.
+        batch_size (int): Rows written per transaction.
+        game_ids (weakref.WeakKeyDictionary[Game4Player, int]): Id given to each game recorded.
+        conn (sqlite3.Connection): Connection used to allocate game ids.
+        error (sqlite3.Error | None): First error of writer thread.
+        rows (queue.Queue): Rows waiting for writer thread, None stops thread.
+        writer (threading.Thread): Background writer thread.
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.game_ids: weakref.WeakKeyDictionary[Game4Player, int] = (
+            weakref.WeakKeyDictionary()
+        )
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.error: sqlite3.Error | None = None
+        self.rows: queue.Queue[tuple[str, tuple] | None] = queue.Queue(queue_size)
+        self.writer = threading.Thread(target=self._write_rows, daemon=True)
+        self.writer.start()
+
+    @staticmethod
+    def strategy(player) -> str:
+        """Strategy name of player, its class name."""
+        return type(player).__name__
+
+    def game_id(self, game: Game4Player) -> int:
+        """Id of game, inserting it into the games table the first time it is seen."""
+        if game not in self.game_ids:
+            with self.conn:
+                cursor = self.conn.execute(
+                    "INSERT INTO games (variant, players) VALUES (?, ?)",
+                    (
+                        game.rules.variant.name,
+                        ",".join(player.player_name for player in game.players),
+                    ),
+                )
+            self.game_ids[game] = cursor.lastrowid
+        return self.game_ids[game]
+
+    def on_round_end(self, game: Game4Player) -> None:
+        """Queue round and seat rows before team scores are totaled."""
+        self._raise_error()
+        game_id = self.game_id(game)
+        caller = game.players[game.trump_player]
+        caller_team = game.team_of(caller)
+        self.rows.put(
+            (
+                "rounds",
+                (
+                    game_id,
+                    game.round_num,
+                    game.rules.variant.name,
+                    game.trump_suit.name,
+                    game.meet_bid,
+                    game.trump_player,
+                    caller.player_name,
+                    self.strategy(caller),
+                    caller_team.team_num,
+                    int(caller_team.round_score >= caller_team.team_bid),
+                ),
+            )
+        )
+        for seat, player in enumerate(game.players):
+            team = game.team_of(player)
+            team_meld = sum(
+                meld
+                for other, meld in zip(game.players, game.meld_scores)
+                if team.on_team(other)
+            )
+            self.rows.put(
+                (
+                    "seats",
+                    (
+                        game_id,
+                        game.round_num,
+                        seat,
+                        player.player_name,
+                        self.strategy(player),
+                        team.team_num,
+                        player.player_bid,
+                        game.meld_scores[seat],
+                        team_meld,
+                        team.round_score - team_meld,
+                        team.round_result(),
+                        team.total_score + team.round_result(),
+                    ),
+                )
+            )
+
+    def _write_rows(self) -> None:
+        """Writer thread, insert queued rows in one transaction per batch until None received."""
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        running = True
+        while running:
+            batch = {table: [] for table in INSERTS}
+            done = 0
+            while done < self.batch_size:
+                try:
+                    row = self.rows.get(timeout=1.0 if done == 0 else 0.05)
+                except queue.Empty:
+                    break
+                done += 1
+                if row is None:
+                    running = False
+                    break
+                table, values = row
+                batch[table].append(values)
+            try:
+                with conn:
+                    for table, values in batch.items():
+                        if values:
+                            conn.executemany(INSERTS[table], values)
+            except sqlite3.Error as err:
+                logging.error(f"Dropped {done} result rows writing {self.path}: {err}")
+                if self.error is None:
+                    self.error = err
+            for _ in range(done):
+                self.rows.task_done()
+        conn.close()
+
+    def _raise_error(self) -> None:
+        """Raise error hit by writer thread."""
+        if self.error is not None:
+            raise self.error
+
+    def flush(self) -> None:
+        """Wait until every queued row is committed."""
+        self.rows.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Commit remaining rows and stop writer thread."""
+        self.rows.put(None)
+        self.writer.join()
+        self.conn.close()
+        self._raise_error()
+
+    def __enter__(self) -> ResultStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def bid_success_rates(self) -> list[tuple[str, str, int, float]]:
+        """Rounds and bid success rate of trump callers by trump suit and strategy."""
+        self.flush()
+        with sqlite3.connect(self.path) as conn:
+            rates = conn.execute(
+                "SELECT trump, caller_strategy, COUNT(*), AVG(made_bid) FROM rounds "
+                "GROUP BY trump, caller_strategy ORDER BY trump, caller_strategy"
+            ).fetchall()
+        conn.close()
+        return rates
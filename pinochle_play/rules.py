@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+
+from pinochle_play.card import Card
+from pinochle_play.common import VALUE_MAP, Suits, Values
+
+PLAIN_SUITS = tuple(suit for suit in Suits if suit != Suits.NONE)
+PLAIN_VALUES = tuple(value for value in Values if value != Values.NONE)
+
+
+@dataclass(frozen=True)
+class Meld:
+    """Meld description.
+
+    Attributes
+    ----------
+    name (str): Meld name for logging.
+    cards (tuple[tuple[Suits, Values], ...]): Cards needed. Suits.NONE means the meld is made in every suit.
+    points (int): Points scored.
+    trump_points (int | None): Points when made in trump suit, same as points if None.
+    each_copy (bool): Score for every copy held of a single card meld instead of once. Scores trump points in every suit before trump is called.
+    """
+
+    name: str
+    cards: tuple[tuple[Suits, Values], ...]
+    points: int
+    trump_points: int | None = None
+    each_copy: bool = False
+
+
+STANDARD_MELDS: tuple[Meld, ...] = (
+    Meld("Pinochle", ((Suits.DIAMOND, Values.JACK), (Suits.CLUB, Values.QUEEN)), 4),
+    Meld("Meld", ((Suits.NONE, Values.NINE),), 0, trump_points=1, each_copy=True),
+    Meld("Marriage", ((Suits.NONE, Values.KING), (Suits.NONE, Values.QUEEN)), 2, 4),
+    Meld(
+        "Run",
+        tuple(
+            (Suits.NONE, value)
+            for value in (
+                Values.ACE,
+                Values.TEN,
+                Values.KING,
+                Values.QUEEN,
+                Values.JACK,
+            )
+        ),
+        15,
+    ),
+) + tuple(
+    Meld(f"4 of a Kind {value}", tuple((suit, value) for suit in PLAIN_SUITS), points)
+    for value, points in (
+        (Values.ACE, 10),
+        (Values.KING, 8),
+        (Values.QUEEN, 6),
+        (Values.JACK, 4),
+    )
+)
+STANDARD_COUNTERS: tuple[tuple[Values, int], ...] = (
+    (Values.ACE, 1),
+    (Values.TEN, 1),
+    (Values.KING, 1),
+)
+
+
+@dataclass(frozen=True)
+class Variant:
+    """Pinochle rules variant.
+
+    Attributes
+    ----------
+    name (str): Variant name.
+    num_players (int): Players at table.
+    num_teams (int): Teams players are split evenly between.
+    copies (int): Copies of each card in deck.
+    values (tuple[Values, ...]): Card values in deck.
+    melds (tuple[Meld, ...]): Melds scored, melds needing cards not in deck are dropped.
+    counters (tuple[tuple[Values, int], ...]): Trick points for each counter value.
+    """
+
+    name: str
+    num_players: int = 4
+    num_teams: int = 2
+    copies: int = 2
+    values: tuple[Values, ...] = PLAIN_VALUES
+    melds: tuple[Meld, ...] = STANDARD_MELDS
+    counters: tuple[tuple[Values, int], ...] = STANDARD_COUNTERS
+
+
+STANDARD = Variant("standard")
+DOUBLE_DECK = Variant("double_deck", copies=4, values=PLAIN_VALUES[1:])
+THREE_PLAYER = Variant("three_player", num_players=3, num_teams=3)
+SIX_PLAYER = Variant("six_player", num_players=6, copies=4)
+EIGHT_PLAYER = Variant("eight_player", num_players=8, copies=4)
+VARIANTS = {
+    variant.name: variant
+    for variant in (STANDARD, DOUBLE_DECK, THREE_PLAYER, SIX_PLAYER, EIGHT_PLAYER)
+}
+
+
+class Rules:
+    """Variant compiled into lookup tables used by deck, meld and trick code.
+
+    Cards are looked up by (suit, value) index into card_types. Melds are compiled
+    per trump suit into tuples of card indexes, and trick strength per trump suit
+    into one rank per card type, so every variant runs the same code paths.
+    """
+
+    def __init__(self, variant: Variant) -> None:
+        """
+        Attributes
+        ----------
+        variant (Variant): Variant compiled.
+        card_types (list[Card]): Distinct cards in deck.
+        index (dict[tuple[Suits, Values], int]): Index of each card type.
+        deck (list[Card]): Unshuffled deck.
+        hand_size (int): Cards dealt to each player.
+        counter_points (list[int]): Trick points of each card type.
+        melds (dict[Suits, list[tuple[str, tuple[int, ...], int, bool]]]): Name, card indexes, points and each copy flag of melds for each trump suit.
+        trick_rank (dict[Suits, list[int]]): Rank of each card type for each trump suit, trump cards outrank all others.
+        """
+        if variant.num_players % variant.num_teams != 0:
+            raise ValueError(
+                f"{variant.num_players} players can't split into {variant.num_teams} teams."
+            )
+        self.variant = variant
+        self.card_types: list[Card] = [
+            Card(suit, value) for suit in PLAIN_SUITS for value in variant.values
+        ]
+        self.index: dict[tuple[Suits, Values], int] = {
+            (card.suit, card.value): idx for idx, card in enumerate(self.card_types)
+        }
+        self.deck: list[Card] = [
+            Card(card.suit, card.value)
+            for card in self.card_types
+            for _ in range(variant.copies)
+        ]
+        if len(self.deck) % variant.num_players != 0:
+            raise ValueError(
+                f"Deck of {len(self.deck)} can't be dealt evenly to {variant.num_players} players."
+            )
+        self.hand_size: int = len(self.deck) // variant.num_players
+        counters = dict(variant.counters)
+        self.counter_points: list[int] = [
+            counters.get(card.value, 0) for card in self.card_types
+        ]
+        self.melds: dict[Suits, list[tuple[str, tuple[int, ...], int, bool]]] = {
+            trump: self._compile_melds(trump) for trump in Suits
+        }
+        self.trick_rank: dict[Suits, list[int]] = {
+            trump: [
+                VALUE_MAP[card.value] + (len(Values) if card.suit == trump else 0)
+                for card in self.card_types
+            ]
+            for trump in Suits
+        }
+
+    def _compile_melds(
+        self, trump: Suits
+    ) -> list[tuple[str, tuple[int, ...], int, bool]]:
+        """Expand per suit melds and resolve card indexes and points for trump suit."""
+        compiled = []
+        for meld in self.variant.melds:
+            per_suit = any(suit == Suits.NONE for suit, _ in meld.cards)
+            for meld_suit in PLAIN_SUITS if per_suit else (Suits.NONE,):
+                cards = [
+                    (meld_suit if suit == Suits.NONE else suit, value)
+                    for suit, value in meld.cards
+                ]
+                if any(card not in self.index for card in cards):
+                    continue
+                points = meld.points
+                is_trump = meld_suit == trump or (
+                    meld.each_copy and trump == Suits.NONE
+                )
+                if per_suit and is_trump and meld.trump_points is not None:
+                    points = meld.trump_points
+                if points == 0:
+                    continue
+                name = f"{meld.name} {meld_suit.value}" if per_suit else meld.name
+                idxs = tuple(self.index[card] for card in cards)
+                compiled.append((name, idxs, points, meld.each_copy))
+        return compiled
+
+    def counts(self, cards: list[Card]) -> list[int]:
+        """Count of each card type in cards."""
+        counts = [0] * len(self.card_types)
+        for card in cards:
+            counts[self.index[(card.suit, card.value)]] += 1
+        return counts
+
+    def score_meld(self, hand: list[Card], trump_suit: Suits = Suits.NONE) -> int:
+        """Meld score of hand for trump suit."""
+        counts = self.counts(hand)
+        score = 0
+        for name, idxs, points, each_copy in self.melds[trump_suit]:
+            if each_copy:
+                meld_score = points * counts[idxs[0]]
+            elif all(counts[idx] > 0 for idx in idxs):
+                meld_score = points
+            else:
+                continue
+            if meld_score > 0:
+                logging.debug(f"{name}, {meld_score} points.")
+                score += meld_score
+        return score
+
+    def trick_points(self, trick: list[Card]) -> int:
+        """Counter points in trick."""
+        return sum(
+            self.counter_points[self.index[(card.suit, card.value)]] for card in trick
+        )
+
+    def trick_winner(self, trick: list[Card], trump_suit: Suits) -> int:
+        """Position in trick of winning card. Only trick suit or trump can win, first played wins ties."""
+        ranks = self.trick_rank[trump_suit]
+        lead_suit = trick[0].suit
+        winner = 0
+        best = -1
+        for idx, card in enumerate(trick):
+            if card.suit != lead_suit and card.suit != trump_suit:
+                continue
+            rank = ranks[self.index[(card.suit, card.value)]]
+            if rank > best:
+                best = rank
+                winner = idx
+        return winner
+
+
+@lru_cache(maxsize=None)
+def compile_rules(variant: Variant = STANDARD) -> Rules:
+    """Compile variant once, later calls share the same tables."""
+    return Rules(variant)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing as mp
+import os
+import random
+from pathlib import Path
+from queue import Empty
+from typing import Callable
+
+import numpy as np
+
+from pinochle_play.card import Card
+from pinochle_play.computer import Computer
+from pinochle_play.features import (
+    NUM_CARD_TYPES,
+    OBS_SIZE,
+    card_index,
+    game_observation,
+    legal_mask,
+)
+from pinochle_play.game import Game4Player
+from pinochle_play.recorder import GameRecorder
+from pinochle_play.rules import STANDARD, Variant
+from pinochle_play.team import Team
+from pinochle_play.workers import WAIT_SECONDS, check_workers
+
+BID = 0
+PLAY = 1
+
+Chunk = dict[str, np.ndarray]
+
+
+class DecisionRecorder(GameRecorder):
+    """Record every bid and card play as one row of fixed size columnar chunks.
+
+    Rows of a round are held until the round ends so the final outcome, the change
+    in total score of the deciding player's team, can be filled in. Full chunks are
+    passed to emit, the last partial chunk is emitted by flush.
+    """
+
+    def __init__(self, chunk_size: int, emit: Callable[[Chunk], None]) -> None:
+        """
+        Attributes
+        ----------
+        chunk_size (int): Rows per emitted chunk.
+        emit (Callable): Receives each full chunk.
+        game_id (int): Id stored with rows of the current game, set by driver.
+        chunk (Chunk): Preallocated columns of chunk being filled.
+        size (int): Rows filled in chunk.
+        pending (list): Rows of current round waiting on outcome.
+        """
+        self.chunk_size = chunk_size
+        self.emit = emit
+        self.game_id: int = 0
+        self.chunk: Chunk = self._new_chunk()
+        self.size: int = 0
+        self.pending: list[tuple[np.ndarray, np.ndarray, int, int, int]] = []
+
+    def _new_chunk(self) -> Chunk:
+        """Allocate empty columns."""
+        return {
+            "obs": np.zeros((self.chunk_size, OBS_SIZE), dtype=np.int16),
+            "legal": np.zeros((self.chunk_size, NUM_CARD_TYPES), dtype=bool),
+            "kind": np.zeros(self.chunk_size, dtype=np.uint8),
+            "action": np.zeros(self.chunk_size, dtype=np.int16),
+            "seat": np.zeros(self.chunk_size, dtype=np.uint8),
+            "game": np.zeros(self.chunk_size, dtype=np.int64),
+            "round": np.zeros(self.chunk_size, dtype=np.int32),
+            "outcome": np.zeros(self.chunk_size, dtype=np.int16),
+        }
+
+    def on_bid(
+        self, game: Game4Player, seat: int, bids_sofar: list[int], bid: int
+    ) -> None:
+        """Record bid with observation of highest bid so far. No card is legal."""
+        player = game.players[seat]
+        max_bid = max(bids_sofar) if len(bids_sofar) > 0 else 0
+        obs = game_observation(game, seat, player.hand, [], max_bid)
+        legal = np.zeros(NUM_CARD_TYPES, dtype=bool)
+        self.pending.append((obs, legal, BID, bid, seat))
+
+    def on_play(
+        self, game: Game4Player, seat: int, trick: list[Card], card: Card
+    ) -> None:
+        """Record card played with observation and legal moves of hand before playing it."""
+        player = game.players[seat]
+        hand = player.hand + [card]
+        obs = game_observation(game, seat, hand, trick, game.meet_bid)
+        legal = legal_mask(player, trick, game.trump_suit, hand=hand)
+        self.pending.append((obs, legal, PLAY, card_index(card), seat))
+
+    def on_round_end(self, game: Game4Player) -> None:
+        """Fill in round outcome for each pending row and move rows into chunk."""
+        outcomes = [game.team_of(player).round_result() for player in game.players]
+        for obs, legal, kind, action, seat in self.pending:
+            row = self.size
+            self.chunk["obs"][row] = obs
+            self.chunk["legal"][row] = legal
+            self.chunk["kind"][row] = kind
+            self.chunk["action"][row] = action
+            self.chunk["seat"][row] = seat
+            self.chunk["game"][row] = self.game_id
+            self.chunk["round"][row] = game.round_num
+            self.chunk["outcome"][row] = outcomes[seat]
+            self.size += 1
+            if self.size == self.chunk_size:
+                self.emit(self.chunk)
+                self.chunk = self._new_chunk()
+                self.size = 0
+        self.pending = []
+
+    def flush(self) -> None:
+        """Emit rows of partially filled chunk."""
+        if self.size > 0:
+            self.emit(
+                {name: column[: self.size] for name, column in self.chunk.items()}
+            )
+            self.chunk = self._new_chunk()
+            self.size = 0
+
+
+def computer_game(variant: Variant = STANDARD) -> Game4Player:
+    """Build game of computer players filling every seat of variant."""
+    game = Game4Player(variant)
+    team_size = variant.num_players // variant.num_teams
+    for team_num in range(1, variant.num_teams + 1):
+        team = Team(team_num)
+        for player_num in range(team_size):
+            team.add_player(
+                Computer(f"Computer {team_num}{chr(ord('a') + player_num)}")
+            )
+        game.add_team(team)
+    return game
+
+
+def _selfplay_worker(
+    seeds: range, queue: mp.Queue, chunk_size: int, max_score: int
+) -> None:
+    """Play one game per seed, putting full chunks on queue then None when done or failed."""
+    logging.disable(logging.CRITICAL)
+    try:
+        recorder = DecisionRecorder(chunk_size, queue.put)
+        for seed in seeds:
+            random.seed(seed)
+            recorder.game_id = seed
+            game = computer_game()
+            game.add_recorder(recorder)
+            game.play(max_score=max_score)
+        recorder.flush()
+    finally:
+        queue.put(None)
+
+
+def generate_dataset(
+    out_dir: str | Path,
+    num_games: int,
+    workers: int = 0,
+    chunk_size: int = 4096,
+    queue_size: int = 8,
+    max_score: int = 120,
+    first_seed: int = 0,
+) -> int:
+    """Simulate games across worker processes, writing compressed chunks to out_dir. Return rows written.
+
+    Workers block on the bounded queue when the writer falls behind, so at most
+    queue_size chunks plus one per worker are held in memory at once.
+    """
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, num_games)
+    queue: mp.Queue = mp.Queue(maxsize=queue_size)
+    bounds = np.linspace(first_seed, first_seed + num_games, workers + 1, dtype=int)
+    processes = [
+        mp.Process(
+            target=_selfplay_worker,
+            args=(range(start, stop), queue, chunk_size, max_score),
+        )
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+    for process in processes:
+        process.start()
+
+    rows = 0
+    chunk_num = 0
+    running = len(processes)
+    while running > 0:
+        try:
+            chunk = queue.get(timeout=WAIT_SECONDS)
+        except Empty:
+            check_workers(processes, "Self play")
+            continue
+        if chunk is None:
+            running -= 1
+            continue
+        np.savez_compressed(out_path / f"chunk_{chunk_num:06d}.npz", **chunk)
+        rows += len(chunk["kind"])
+        chunk_num += 1
+    for process in processes:
+        process.join()
+    check_workers(processes, "Self play")
+    logging.info(f"Wrote {rows} decisions in {chunk_num} chunks to {out_path}")
+    return rows
+
+
+def main() -> None:
+    """Generate self play dataset from command line."""
+    parser = argparse.ArgumentParser(description="Generate pinochle self play dataset.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument("--queue-size", type=int, default=8)
+    parser.add_argument("--max-score", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    generate_dataset(
+        args.out_dir,
+        args.games,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        queue_size=args.queue_size,
+        max_score=args.max_score,
+        first_seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
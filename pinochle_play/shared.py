@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing as mp
+import os
+import queue
+import random
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from pinochle_play.card import Card
+from pinochle_play.common import Suits
+from pinochle_play.game import Game4Player
+from pinochle_play.recorder import GameRecorder
+from pinochle_play.rules import STANDARD, VARIANTS, Rules, Variant, compile_rules
+from pinochle_play.selfplay import computer_game
+from pinochle_play.workers import WAIT_SECONDS, check_workers
+
+CLOSED = -1
+SUIT_CODES = {suit: idx for idx, suit in enumerate(Suits)}
+
+
+class SharedRing:
+    """Fixed size records in shared memory handed between processes by slot index.
+
+    Free and full slot indexes travel over queues, records themselves are never
+    pickled. Producers acquire a free slot, fill it and publish it; consumers take
+    a full slot, read it and release it. CLOSED taken from the full queue means
+    the producer is done.
+    """
+
+    def __init__(self, dtype: np.dtype, capacity: int) -> None:
+        """
+        Attributes
+        ----------
+        dtype (np.dtype): Structured record layout.
+        capacity (int): Number of slots.
+        shm (shared_memory.SharedMemory): Block holding the slots.
+        slots (np.ndarray): Records viewed over shared memory.
+        free (mp.Queue): Indexes of slots ready to fill.
+        full (mp.Queue): Indexes of slots ready to read.
+        owner_pid (int): Creating process, which unlinks the block on close.
+        """
+        self.dtype = np.dtype(dtype)
+        self.capacity = capacity
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=self.dtype.itemsize * capacity
+        )
+        self.slots = np.ndarray(capacity, dtype=self.dtype, buffer=self.shm.buf)
+        self.free: mp.Queue = mp.Queue()
+        self.full: mp.Queue = mp.Queue()
+        for slot in range(capacity):
+            self.free.put(slot)
+        self.owner_pid = os.getpid()
+
+    def __getstate__(self) -> dict:
+        """Pass only block name and queues to child processes."""
+        return {
+            "dtype": self.dtype,
+            "capacity": self.capacity,
+            "name": self.shm.name,
+            "free": self.free,
+            "full": self.full,
+            "owner_pid": self.owner_pid,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """Attach to parent's shared memory block."""
+        self.dtype = state["dtype"]
+        self.capacity = state["capacity"]
+        self.shm = shared_memory.SharedMemory(name=state["name"])
+        self.slots = np.ndarray(self.capacity, dtype=self.dtype, buffer=self.shm.buf)
+        self.free = state["free"]
+        self.full = state["full"]
+        self.owner_pid = state["owner_pid"]
+
+    def acquire(self, timeout: float | None = None) -> int:
+        """Wait for free slot to fill, raising queue.Empty after timeout."""
+        return self.free.get(timeout=timeout)
+
+    def publish(self, slot: int) -> None:
+        """Hand filled slot to consumers."""
+        self.full.put(slot)
+
+    def take(self, timeout: float | None = None) -> int:
+        """Wait for filled slot, CLOSED once producer is done, raising queue.Empty after timeout."""
+        return self.full.get(timeout=timeout)
+
+    def release(self, slot: int) -> None:
+        """Give read slot back to producers."""
+        self.free.put(slot)
+
+    def finish(self, consumers: int) -> None:
+        """Tell every consumer there are no more records."""
+        for _ in range(consumers):
+            self.full.put(CLOSED)
+
+    def close(self) -> None:
+        """Detach from block, removing it if this process created it."""
+        del self.slots
+        self.shm.close()
+        if os.getpid() == self.owner_pid:
+            self.shm.unlink()
+
+
+def deal_dtype(rules: Rules) -> np.dtype:
+    """Deal layout, seed and card type index of each card in deal order."""
+    return np.dtype([("seed", "<i8"), ("cards", "u1", (len(rules.deck),))])
+
+
+def record_dtype(rules: Rules) -> np.dtype:
+    """Round record layout, deal seed, trump, bid, caller, meld per seat and round scores per team."""
+    players = rules.variant.num_players
+    teams = rules.variant.num_teams
+    return np.dtype(
+        [
+            ("seed", "<i8"),
+            ("round_num", "<i4"),
+            ("trump", "u1"),
+            ("bid", "<i2"),
+            ("caller", "u1"),
+            ("melds", "<i2", (players,)),
+            ("round_scores", "<i2", (teams,)),
+            ("results", "<i2", (teams,)),
+        ]
+    )
+
+
+def encode_deal(rules: Rules, deck: list[Card], seed: int, out: np.void) -> None:
+    """Write deck as card type indexes into deal record."""
+    out["seed"] = seed
+    out["cards"] = [rules.index[(card.suit, card.value)] for card in deck]
+
+
+def decode_deal(rules: Rules, record: np.void) -> list[Card]:
+    """Deck in deal order from deal record."""
+    return [rules.card_types[idx] for idx in record["cards"].tolist()]
+
+
+def produce_deals(
+    ring: SharedRing,
+    rules: Rules,
+    seeds: range,
+    consumers: int,
+    stop: threading.Event,
+) -> None:
+    """Shuffle one deal per seed into ring, then close it for consumers.
+
+    Gives up without closing the ring once stop is set while waiting for a free slot.
+    """
+    for seed in seeds:
+        deck = list(rules.deck)
+        random.Random(seed).shuffle(deck)
+        while True:
+            try:
+                slot = ring.acquire(timeout=WAIT_SECONDS)
+                break
+            except queue.Empty:
+                if stop.is_set():
+                    return
+        encode_deal(rules, deck, seed, ring.slots[slot])
+        ring.publish(slot)
+    ring.finish(consumers)
+
+
+class RecordPublisher(GameRecorder):
+    """Publish a compact record of every finished round to a ring.
+
+    Set seed to the seed of the deal before playing each round.
+    """
+
+    def __init__(self, ring: SharedRing) -> None:
+        """
+        Attributes
+        ----------
+        ring (SharedRing): Ring of record_dtype records.
+        seed (int): Seed of deal being played.
+        """
+        self.ring = ring
+        self.seed = 0
+
+    def on_round_end(self, game: Game4Player) -> None:
+        """Write round record into a free slot and publish it."""
+        slot = self.ring.acquire()
+        record = self.ring.slots[slot]
+        record["seed"] = self.seed
+        record["round_num"] = game.round_num
+        record["trump"] = SUIT_CODES[game.trump_suit]
+        record["bid"] = game.meet_bid
+        record["caller"] = game.trump_player
+        record["melds"] = game.meld_scores
+        record["round_scores"] = [team.round_score for team in game.teams]
+        record["results"] = [team.round_result() for team in game.teams]
+        self.ring.publish(slot)
+
+
+def _play_deals(deals: SharedRing, records: SharedRing, variant: Variant) -> None:
+    """Play a fresh computer game round seeded by each deal taken from ring until closed.
+
+    Results depend only on the deal seed, not on which worker played it. The
+    records ring is closed for this worker even if a round fails.
+    """
+    logging.disable(logging.CRITICAL)
+    try:
+        rules = compile_rules(variant)
+        publisher = RecordPublisher(records)
+        while True:
+            slot = deals.take()
+            if slot == CLOSED:
+                break
+            publisher.seed = int(deals.slots[slot]["seed"])
+            deck = decode_deal(rules, deals.slots[slot])
+            deals.release(slot)
+            random.seed(publisher.seed)
+            game = computer_game(variant)
+            game.add_recorder(publisher)
+            game.play_round(deck)
+    finally:
+        records.finish(1)
+        deals.close()
+        records.close()
+
+
+def simulate_shared(
+    num_deals: int,
+    workers: int = 0,
+    variant: Variant = STANDARD,
+    capacity: int = 256,
+    first_seed: int = 0,
+) -> np.ndarray:
+    """Play one round per deal on worker processes fed through shared memory rings.
+
+    A producer thread fills the deal ring while this process reads round records
+    back, so only slot indexes cross process boundaries. Returns the result of
+    every team per round, row i for seed first_seed + i. Raises RuntimeError if
+    a worker fails.
+    """
+    rules = compile_rules(variant)
+    workers = workers or os.cpu_count() or 1
+    deals = SharedRing(deal_dtype(rules), capacity)
+    records = SharedRing(record_dtype(rules), capacity)
+    processes = [
+        mp.Process(target=_play_deals, args=(deals, records, variant))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=produce_deals,
+        args=(deals, rules, range(first_seed, first_seed + num_deals), workers, stop),
+    )
+    producer.start()
+
+    results = np.zeros((num_deals, variant.num_teams), dtype=np.int16)
+    running = workers
+    try:
+        while running > 0:
+            try:
+                slot = records.take(timeout=WAIT_SECONDS)
+            except queue.Empty:
+                check_workers(processes, "Shared memory")
+                continue
+            if slot == CLOSED:
+                running -= 1
+                continue
+            record = records.slots[slot]
+            results[record["seed"] - first_seed] = record["results"]
+            records.release(slot)
+        for process in processes:
+            process.join()
+        check_workers(processes, "Shared memory")
+    finally:
+        stop.set()
+        producer.join()
+        deals.close()
+        records.close()
+    return results
+
+
+def main() -> None:
+    """Run shared memory simulation from command line."""
+    parser = argparse.ArgumentParser(description="Shared memory pinochle simulation.")
+    parser.add_argument("--deals", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--variant", choices=list(VARIANTS), default=STANDARD.name)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    results = simulate_shared(
+        args.deals, workers=args.workers, variant=VARIANTS[args.variant]
+    )
+    logging.info(f"Played {len(results)} rounds, mean result {results.mean(axis=0)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -40,12 +40,15 @@ class Team:
 
         If miss bid, lose points from total score. Reset round score to 0.
         """
-        if self.round_score < self.team_bid:
-            self.total_score -= self.team_bid
-        else:
-            self.total_score += self.round_score
+        self.total_score += self.round_result()
         self.round_score = 0
 
+    def round_result(self) -> int:
+        """Change to total score from round, minus the bid if missed else round score."""
+        if self.round_score < self.team_bid:
+            return -self.team_bid
+        return self.round_score
+
     def add_score(self, score: int) -> None:
         """Add to round score based on both players meld, tricks won in round"""
         self.round_score += score
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+
+WAIT_SECONDS = 1.0
+
+
+def check_workers(processes: list[mp.Process], label: str) -> None:
+    """Stop every worker and raise if any worker exited with an error. Label names the worker kind."""
+    failed = [
+        process.exitcode
+        for process in processes
+        if process.exitcode is not None and process.exitcode != 0
+    ]
+    if failed:
+        for process in processes:
+            process.terminate()
+        raise RuntimeError(f"{label} worker failed with exit code {failed[0]}.")
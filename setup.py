@@ -7,4 +7,5 @@ setup(
     author="Joseh Palombo",
     packages=["pinochle_play"],
     setup_requires=["pandas"],
+    install_requires=["numpy"],
 )
@@ -0,0 +1,33 @@
+import pytest
+
+from pinochle_play.card import Card
+from pinochle_play.common import Suits, Values
+from pinochle_play.computer import Computer
+
+H, S, C, D = Suits.HEART, Suits.SPADE, Suits.CLUB, Suits.DIAMOND
+
+
+@pytest.fixture
+def computer():
+    player = Computer("1a")
+    player.hand = [
+        Card(H, Values.NINE),
+        Card(H, Values.ACE),
+        Card(S, Values.TEN),
+        Card(C, Values.KING),
+    ]
+    return player
+
+
+def test_force_move_follows_trick_suit_before_single_trump(computer):
+    assert computer.force_move(H, S).suit == Suits.NONE
+
+
+def test_force_move_plays_single_trump_without_trick_suit(computer):
+    card = computer.force_move(D, S)
+    assert (card.suit, card.value) == (S, Values.TEN)
+
+
+def test_force_move_plays_single_trick_suit_card(computer):
+    card = computer.force_move(C, S)
+    assert (card.suit, card.value) == (C, Values.KING)
@@ -0,0 +1,114 @@
+import pytest
+
+from pinochle_play.card import Card
+from pinochle_play.common import Suits, Values
+from pinochle_play.computer import Computer
+from pinochle_play.game import Game4Player
+from pinochle_play.rules import STANDARD, VARIANTS, compile_rules
+
+H, S, C, D = Suits.HEART, Suits.SPADE, Suits.CLUB, Suits.DIAMOND
+
+
+def cards(*pairs: tuple[Suits, Values]) -> list[Card]:
+    return [Card(suit, value) for suit, value in pairs]
+
+
+@pytest.fixture
+def rules():
+    return compile_rules(STANDARD)
+
+
+@pytest.mark.parametrize(
+    "hand, trump, score",
+    [
+        (cards((D, Values.JACK), (C, Values.QUEEN)), H, 4),
+        (cards((H, Values.KING), (H, Values.QUEEN)), H, 4),
+        (cards((H, Values.KING), (H, Values.QUEEN)), S, 2),
+        (cards((H, Values.KING), (H, Values.QUEEN)), Suits.NONE, 2),
+        (
+            cards(
+                (H, Values.ACE),
+                (H, Values.TEN),
+                (H, Values.KING),
+                (H, Values.QUEEN),
+                (H, Values.JACK),
+            ),
+            S,
+            17,
+        ),
+        (cards(*((suit, Values.ACE) for suit in (H, S, C, D))), H, 10),
+        (cards(*((suit, Values.KING) for suit in (H, S, C, D))), H, 8),
+        (cards(*((suit, Values.QUEEN) for suit in (H, S, C, D))), H, 6),
+        (cards(*((suit, Values.JACK) for suit in (H, S, C, D))), H, 4),
+    ],
+)
+def test_standard_meld_scores(rules, hand, trump, score):
+    assert rules.score_meld(hand, trump) == score
+
+
+def test_nines_count_for_trump_only_once_called(rules):
+    hand = cards((H, Values.NINE), (H, Values.NINE), (S, Values.NINE))
+    assert rules.score_meld(hand, H) == 2
+    assert rules.score_meld(hand, S) == 1
+    assert rules.score_meld(hand, C) == 0
+
+
+def test_nines_count_in_every_suit_before_trump_called(rules):
+    hand = cards((H, Values.NINE), (H, Values.NINE), (S, Values.NINE))
+    assert rules.score_meld(hand, Suits.NONE) == 3
+
+
+def test_player_score_hand_uses_rules(rules):
+    player = Computer("p")
+    player.hand = cards((D, Values.JACK), (C, Values.QUEEN), (C, Values.NINE))
+    assert player.score_hand(C) == rules.score_meld(player.hand, C) == 5
+
+
+@pytest.mark.parametrize(
+    "trick, trump, winner",
+    [
+        (cards((H, Values.TEN), (H, Values.ACE), (H, Values.KING)), S, 1),
+        (cards((H, Values.NINE), (C, Values.ACE), (D, Values.ACE)), S, 0),
+        (cards((H, Values.ACE), (S, Values.NINE), (H, Values.ACE)), S, 1),
+        (cards((H, Values.ACE), (H, Values.ACE), (H, Values.ACE)), S, 0),
+        (cards((H, Values.KING), (S, Values.TEN), (S, Values.TEN)), S, 1),
+        (cards((S, Values.JACK), (H, Values.ACE), (S, Values.JACK)), S, 0),
+    ],
+)
+def test_trick_winner_first_played_wins_ties(rules, trick, trump, winner):
+    assert rules.trick_winner(trick, trump) == winner
+
+
+def test_game_trick_winner_offsets_from_leader():
+    game = Game4Player()
+    game.players = [Computer(name) for name in "abcd"]
+    game.trump_suit = S
+    trick = cards((H, Values.KING), (H, Values.ACE), (H, Values.ACE), (C, Values.ACE))
+    assert game.trick_winner(trick, 3) == 0
+
+
+@pytest.mark.parametrize(
+    "name, deck_size, hand_size",
+    [
+        ("standard", 48, 12),
+        ("double_deck", 80, 20),
+        ("three_player", 48, 16),
+        ("six_player", 96, 16),
+        ("eight_player", 96, 12),
+    ],
+)
+def test_variant_deck_and_hand_size(name, deck_size, hand_size):
+    rules = compile_rules(VARIANTS[name])
+    assert len(rules.deck) == deck_size
+    assert rules.hand_size == hand_size
+    assert len(rules.deck) == rules.variant.num_players * hand_size
+
+
+def test_variants_cover_every_name():
+    assert set(VARIANTS) == {
+        "standard",
+        "double_deck",
+        "three_player",
+        "six_player",
+        "eight_player",
+    }
@@ -0,0 +1,16 @@
+import numpy as np
+
+from pinochle_play.shared import simulate_shared
+
+
+def test_results_do_not_depend_on_worker_count():
+    single = simulate_shared(60, workers=1, capacity=8, first_seed=5)
+    several = simulate_shared(60, workers=3, capacity=8, first_seed=5)
+    assert single.shape == (60, 2)
+    np.testing.assert_array_equal(single, several)
+
+
+def test_results_repeat_for_same_seeds():
+    first = simulate_shared(60, workers=3, capacity=8)
+    second = simulate_shared(60, workers=3, capacity=8)
+    np.testing.assert_array_equal(first, second)